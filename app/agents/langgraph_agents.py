@@ -1,7 +1,6 @@
+from typing import Optional, TypedDict
 from langgraph.graph import StateGraph, END
-from typing import TypedDict, Annotated
-import operator
-from services.ollama_client import OllamaClient
+from app.services.ollama_client import OllamaClient
 
 # define shared state
 class GraphState(TypedDict):
@@ -9,34 +8,60 @@ class GraphState(TypedDict):
     analysis: str
     summary: str
 
-# Define nodes (functions that process state)
-def analyze_text(state: GraphState) -> GraphState:
 
-    client = OllamaClient()
-    response = client.generate(f"Analyze this text: {state['text']}")
-    state['analysis'] = response['response']
-    return state
+def build_graph(model: Optional[str] = None):
+    """
+    Build the analyze -> summarize workflow for a model.
 
-def summarize(state: GraphState) -> GraphState:
+    Args:
+        model: Ollama model name. If None, uses default from config.
 
-    client = OllamaClient()
-    response = client.generate(f"Summarize: {state['analysis']}")
-    state['summary'] = response['response']
-    return state
+    Returns:
+        Compiled LangGraph workflow
+    """
+    client = OllamaClient(model=model)
 
-# Build the graph
-workflow = StateGraph(GraphState)
+    # Define nodes (functions that process state)
+    def analyze_text(state: GraphState) -> GraphState:
+        response = client.generate(f"Analyze this text: {state['text']}")
+        state['analysis'] = response['response']
+        return state
 
-# Add nodes
-workflow.add_node("analyze", analyze_text)
-workflow.add_node("summarize", summarize)
+    def summarize(state: GraphState) -> GraphState:
+        response = client.generate(f"Summarize: {state['analysis']}")
+        state['summary'] = response['response']
+        return state
 
-# Add edges (define flow)
-workflow.set_entry_point("analyze")
-workflow.add_edge("analyze", "summarize")
-workflow.add_edge("summarize", END)
+    # Build the graph
+    workflow = StateGraph(GraphState)
 
-app = workflow.compile()
+    # Add nodes
+    workflow.add_node("analyze", analyze_text)
+    workflow.add_node("summarize", summarize)
 
-result = app.invoke({"text": "tell me about continual leearning"})
-print(result)
\ No newline at end of file
+    # Add edges (define flow)
+    workflow.set_entry_point("analyze")
+    workflow.add_edge("analyze", "summarize")
+    workflow.add_edge("summarize", END)
+
+    return workflow.compile()
+
+
+def run_langgraph_flow(text: str, model: Optional[str] = None) -> str:
+    """
+    Run the analyze -> summarize workflow on the provided text.
+
+    Args:
+        text: Text to analyze
+        model: Ollama model name. If None, uses default from config.
+
+    Returns:
+        str: The final summary
+    """
+    result = build_graph(model).invoke({"text": text})
+    return result['summary']
+
+
+if __name__ == "__main__":
+    result = build_graph().invoke({"text": "tell me about continual leearning"})
+    print(result)
@@ -2,7 +2,7 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routes import health, llm
+from app.routes import compare, health, llm
 from app.utils import setup_logging
 
 # Setup logging
@@ -27,6 +27,7 @@ app.add_middleware(
 # Include routers
 app.include_router(health.router, tags=["health"])
 app.include_router(llm.router, prefix="/llm", tags=["llm"])
+app.include_router(compare.router, prefix="/compare", tags=["compare"])
 
 
 @app.get("/")
@@ -0,0 +1,176 @@
+"""MCP server exposing generation and agent tools on a warm in-process runtime.
+
+Run over stdio (for Claude Desktop and other MCP clients):
+    python -m app.mcp_server
+
+Or over HTTP:
+    python -m app.mcp_server --transport streamable-http
+
+config.yaml and the shared state database resolve from the project root,
+so the server can be started from any working directory; pass --config to
+use another config file.
+"""
+
+import argparse
+import asyncio
+import logging
+from typing import Callable, Optional
+
+from mcp.server.fastmcp import Context, FastMCP
+
+from app.services.agent_runtime import AgentRuntime
+from app.services.shared_state import SharedState
+from app.utils import load_config, setup_logging
+
+logger = logging.getLogger(__name__)
+
+# Built in configure() so --config can choose the file before anything loads
+runtime: Optional[AgentRuntime] = None
+# Bounds concurrent tool calls so agent callers cannot oversubscribe Ollama
+tool_slots: Optional[asyncio.Semaphore] = None
+
+
+def configure(config_path: str = "config.yaml"):
+    """
+    Build the shared runtime and tool limit from a config file.
+
+    Args:
+        config_path: Path to config file; relative paths fall back to the project root
+    """
+    global runtime, tool_slots
+    config = load_config(config_path)
+    state = SharedState(config=config.get('server', {}))
+    runtime = AgentRuntime(config=config, state=state)
+    tool_slots = asyncio.Semaphore(config.get('mcp', {}).get('max_concurrent_tools', 4))
+
+
+def _runtime() -> AgentRuntime:
+    """Return the runtime, configuring it from config.yaml if main() did not."""
+    if runtime is None:
+        configure()
+    return runtime
+
+
+mcp = FastMCP("crewai-playground")
+
+
+async def _stream_to_client(ctx: Context, fn: Callable, *args):
+    """
+    Run a blocking runtime call in a thread, forwarding its emitted messages
+    to the client as progress notifications while it runs.
+
+    The local tool slot is held until the thread finishes, even if the tool
+    call is cancelled, because the thread keeps using Ollama until then. The
+    runtime additionally takes a server.max_inflight slot shared with the
+    API inside the thread.
+
+    Args:
+        ctx: Tool call context
+        fn: Runtime method taking *args and an emit callback
+
+    Returns:
+        The runtime call's return value
+    """
+    loop = asyncio.get_running_loop()
+    messages: asyncio.Queue = asyncio.Queue()
+
+    def emit(message: str):
+        loop.call_soon_threadsafe(messages.put_nowait, message)
+
+    async def forward():
+        step = 0
+        while (message := await messages.get()) is not None:
+            step += 1
+            try:
+                await ctx.report_progress(step, message=message)
+            except Exception as e:
+                # Progress is best effort; never let it replace the tool result
+                logger.warning(f'Dropping progress update: {e}')
+
+    await tool_slots.acquire()
+    work = asyncio.ensure_future(asyncio.to_thread(fn, *args, emit))
+    work.add_done_callback(lambda _: tool_slots.release())
+
+    forwarder = asyncio.create_task(forward())
+    try:
+        return await asyncio.shield(work)
+    finally:
+        messages.put_nowait(None)
+        if work.done():
+            await forwarder
+        else:
+            forwarder.cancel()
+
+
+@mcp.tool()
+async def generate_text(prompt: str, ctx: Context, model: Optional[str] = None) -> str:
+    """
+    Generate text with an Ollama model, streaming chunks as progress.
+
+    Args:
+        prompt: Text prompt for generation
+        model: Model to use (default: the active model)
+    """
+    return await _stream_to_client(ctx, _runtime().generate, prompt, model)
+
+
+@mcp.tool()
+async def list_models(refresh: bool = False) -> dict:
+    """
+    List available Ollama models, those supported by this app, and the active one.
+
+    Args:
+        refresh: Bypass the cached model catalog
+    """
+    return await asyncio.to_thread(_runtime().list_models, refresh)
+
+
+@mcp.tool()
+async def run_crew_analysis(text: str, ctx: Context, model: Optional[str] = None) -> str:
+    """
+    Analyze text with the CrewAI analyst/summarizer crew, streaming each task's output.
+
+    Args:
+        text: Text to analyze
+        model: Model to use (default: the active model)
+    """
+    return await _stream_to_client(ctx, _runtime().run_crew, text, model)
+
+
+@mcp.tool()
+async def run_langgraph_flow(text: str, ctx: Context, model: Optional[str] = None) -> str:
+    """
+    Analyze text with the LangGraph analyze -> summarize workflow, streaming each step.
+
+    Args:
+        text: Text to analyze
+        model: Model to use (default: the active model)
+    """
+    return await _stream_to_client(ctx, _runtime().run_graph, text, model)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the CrewAI Playground MCP server")
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "sse", "streamable-http"],
+        default="stdio"
+    )
+    parser.add_argument(
+        "--config",
+        default="config.yaml",
+        help="Config file (default: config.yaml in the working directory or project root)"
+    )
+    args = parser.parse_args()
+
+    # Logs go to stderr; stdout belongs to the stdio transport
+    setup_logging("INFO")
+    configure(args.config)
+    # Warm once per process here: FastMCP's lifespan runs again for every
+    # client session on the HTTP transports
+    runtime.warm_up()
+    mcp.run(transport=args.transport)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 """Pydantic models for request/response validation."""
 
 from pydantic import BaseModel, Field
-from typing import Optional, Any
+from typing import Optional, Any, Literal
 
 
 class GenerateRequest(BaseModel):
@@ -9,6 +9,7 @@ class GenerateRequest(BaseModel):
     prompt: str = Field(..., description="Text prompt for generation")
     stream: bool = Field(False, description="Enable streaming response")
     think: bool = Field(False, description="Enable thinking mode (if supported)")
+    use_cache: bool = Field(True, description="Serve a repeat prompt from the shared response cache")
 
 
 class GenerateResponse(BaseModel):
@@ -17,6 +18,7 @@ class GenerateResponse(BaseModel):
     model: str = Field(..., description="Model used for generation")
     created_at: Optional[str] = Field(None, description="Timestamp of generation")
     done: bool = Field(True, description="Whether generation is complete")
+    cached: bool = Field(False, description="Whether served from the shared response cache")
 
 
 class SwitchModelRequest(BaseModel):
@@ -42,3 +44,56 @@ class HealthResponse(BaseModel):
     status: str = Field(..., description="Health status (healthy/unhealthy)")
     ollama_running: bool = Field(..., description="Whether Ollama is running")
     details: Optional[dict] = Field(None, description="Additional health information")
+
+
+class CompareRequest(BaseModel):
+    """Request model for a multi-model comparison."""
+    prompts: list[str] = Field(..., min_length=1, description="Prompts to run on every model")
+    models: Optional[list[str]] = Field(
+        None, min_length=1, description="Models to compare (omit for supported_models)"
+    )
+    pipelines: list[Literal["generate", "crewai", "langgraph"]] = Field(
+        ["generate"], description="Pipelines to run each prompt through"
+    )
+
+
+class CompareRun(BaseModel):
+    """Result of one prompt on one model and pipeline."""
+    model: str = Field(..., description="Model name")
+    pipeline: str = Field(..., description="Pipeline the prompt ran through")
+    prompt: str = Field(..., description="Prompt text")
+    output: Optional[str] = Field(None, description="Generated text")
+    load_ms: Optional[float] = Field(None, description="Model load time Ollama spent in this run in ms (generate only)")
+    ttft_ms: Optional[float] = Field(None, description="Time to first token in ms (generate only)")
+    tokens_per_sec: Optional[float] = Field(None, description="Generation speed (generate only)")
+    total_latency_ms: Optional[float] = Field(None, description="Wall-clock latency in ms")
+    error: Optional[str] = Field(None, description="Error message if the run failed")
+
+
+class CompareSummary(BaseModel):
+    """Aggregated metrics for one model and pipeline."""
+    model: str = Field(..., description="Model name")
+    pipeline: str = Field(..., description="Pipeline name")
+    load_time_ms: Optional[float] = Field(None, description="Time Ollama took to load the model in ms")
+    mean_run_load_ms: Optional[float] = Field(None, description="Mean load time inside runs in ms; high values mean the model was reloaded")
+    mean_ttft_ms: Optional[float] = Field(None, description="Mean time to first token in ms")
+    mean_tokens_per_sec: Optional[float] = Field(None, description="Mean generation speed")
+    mean_total_latency_ms: Optional[float] = Field(None, description="Mean wall-clock latency in ms")
+    errors: int = Field(0, description="Number of failed runs")
+    load_error: Optional[str] = Field(None, description="Error message if the model failed to load")
+
+
+class CompareResponse(BaseModel):
+    """Response model for a multi-model comparison."""
+    id: str = Field(..., description="Comparison id for later lookup")
+    prompts: list[str] = Field(..., description="Prompts that were run")
+    models: list[str] = Field(..., description="Models that were compared")
+    pipelines: list[str] = Field(..., description="Pipelines that were run")
+    runs: list[CompareRun] = Field(..., description="Per-prompt results side by side")
+    summary: list[CompareSummary] = Field(..., description="Per-model, per-pipeline metrics")
+
+
+class CompareHistoryResponse(BaseModel):
+    """Response model for listing stored comparisons."""
+    comparisons: list[dict] = Field(..., description="Comparison ids with status and timestamps")
+    count: int = Field(..., description="Number of comparisons returned")
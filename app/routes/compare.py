@@ -0,0 +1,89 @@
+"""Multi-model comparison endpoints."""
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
+from app.models.schemas import (
+    CompareRequest,
+    CompareResponse,
+    CompareHistoryResponse
+)
+from app.services.comparison import ComparisonRunner
+
+router = APIRouter()
+
+
+@router.post("", response_model=CompareResponse)
+async def run_comparison(request: CompareRequest):
+    """
+    Run prompts on several models and pipelines concurrently.
+
+    Args:
+        request: CompareRequest with prompts, models and pipelines
+
+    Returns:
+        CompareResponse with outputs side by side and per-model metrics
+    """
+    try:
+        runner = ComparisonRunner()
+        result = await runner.run(
+            prompts=request.prompts,
+            models=request.models,
+            pipelines=request.pipelines
+        )
+        return CompareResponse(**result)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Comparison failed: {str(e)}"
+        )
+
+
+@router.get("", response_model=CompareHistoryResponse)
+async def list_comparisons(limit: int = 20):
+    """
+    List stored comparisons, newest first.
+
+    Args:
+        limit: Maximum number of comparisons to return
+
+    Returns:
+        CompareHistoryResponse with comparison ids and status
+    """
+    comparisons = ComparisonRunner().history(limit)
+    return CompareHistoryResponse(
+        comparisons=comparisons,
+        count=len(comparisons)
+    )
+
+
+@router.get("/{comparison_id}", response_model=CompareResponse)
+async def get_comparison(comparison_id: str):
+    """
+    Fetch a stored comparison.
+
+    Args:
+        comparison_id: Id returned by POST /compare
+
+    Returns:
+        CompareResponse for a finished comparison, or 202 with its status
+        while it is still running
+    """
+    job = ComparisonRunner().get(comparison_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Comparison {comparison_id} not found"
+        )
+    if job['status'] == 'running':
+        return JSONResponse(
+            status_code=202,
+            content={"id": comparison_id, "status": "running"}
+        )
+    if job['status'] == 'failed':
+        raise HTTPException(
+            status_code=500,
+            detail=f"Comparison failed: {job['result']['error']}"
+        )
+    return CompareResponse(**job['result'])
@@ -1,5 +1,6 @@
 """LLM-related endpoints."""
 
+import asyncio
 from fastapi import APIRouter, HTTPException
 from app.models.schemas import (
     GenerateRequest,
@@ -9,10 +10,18 @@ from app.models.schemas import (
     ModelsResponse
 )
 from app.services.ollama_client import OllamaClient
+from app.services.shared_state import INFLIGHT_SLOTS, cache_key, get_shared_state
 
 router = APIRouter()
 
 
+def _active_client() -> OllamaClient:
+    """Create a client bound to the model active across all workers."""
+    client = OllamaClient()
+    client.model = get_shared_state().get_active_model(client.model)
+    return client
+
+
 @router.get("/models", response_model=ModelsResponse)
 async def list_models():
     """
@@ -46,24 +55,59 @@ async def generate_text(request: GenerateRequest):
 
     Returns:
         GenerateResponse with generated text
+
+    Raises:
+        HTTPException 429 if too many generations are in flight across workers
     """
+    state = get_shared_state()
     try:
-        client = OllamaClient()
-        response = client.generate(
-            user_input=request.prompt,
-            think=request.think,
-            stream=request.stream
+        # SQLite calls can wait on other workers' locks, so keep them off the event loop
+        client = await asyncio.to_thread(_active_client)
+        key = cache_key(
+            'generate',
+            client.model,
+            request.prompt,
+            request.think,
+            request.stream,
+            client.config.get('temperature', 0.7)
         )
+        if request.use_cache:
+            cached = await asyncio.to_thread(state.cache_get, key)
+            if cached is not None:
+                return GenerateResponse(**cached, cached=True)
+
+        limit = state.config.get('max_inflight', 4)
+        slot = await asyncio.to_thread(state.try_acquire, INFLIGHT_SLOTS, limit)
+        if slot is None:
+            raise HTTPException(
+                status_code=429,
+                detail=f"Too many generations in flight (limit {limit}), retry later"
+            )
+        try:
+            # Run off the event loop so the worker keeps serving (and heartbeating)
+            response = await asyncio.to_thread(
+                client.generate,
+                user_input=request.prompt,
+                think=request.think,
+                stream=request.stream
+            )
+        finally:
+            await asyncio.to_thread(state.release, slot)
 
         # Extract the response text from Ollama's response
         generated_text = response.get('response', '')
 
-        return GenerateResponse(
+        result = GenerateResponse(
             response=generated_text,
             model=client.model,
             created_at=response.get('created_at'),
             done=response.get('done', True)
         )
+        if request.use_cache:
+            await asyncio.to_thread(state.cache_set, key, result.model_dump(exclude={'cached'}))
+        return result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -83,10 +127,11 @@ async def switch_model(request: SwitchModelRequest):
         SwitchModelResponse with success status
     """
     try:
-        client = OllamaClient()
+        client = _active_client()
         success = client.change_model(request.model)
 
         if success:
+            get_shared_state().set_active_model(client.model)
             return SwitchModelResponse(
                 success=True,
                 model=client.model,
@@ -0,0 +1,279 @@
+"""Warm in-process runtime shared by long-lived callers such as the MCP server.
+
+Holds one OllamaClient per model, a cached model catalog, a pool of
+prebuilt crews per model and one compiled LangGraph workflow per model, so
+repeated calls skip the framework imports and object construction.
+"""
+
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
+
+from app.services.ollama_client import OllamaClient
+from app.services.shared_state import INFLIGHT_SLOTS, SharedState, cache_key, get_shared_state
+from app.utils import load_config, probe_models
+
+logger = logging.getLogger(__name__)
+
+Emit = Callable[[str], None]
+
+
+def _ignore(message: str):
+    """Default emit callback that drops progress messages."""
+
+
+class AgentRuntime():
+
+    def __init__(self, config: Optional[dict] = None, state: Optional[SharedState] = None):
+        """
+        Initialize AgentRuntime.
+
+        Args:
+            config: Full configuration dict. If None, loads from config.yaml.
+            state: Shared state for the active model and response cache.
+                If None, uses the process-wide shared state.
+        """
+        if config is None:
+            config = load_config()
+
+        self.ollama_config = config.get('ollama', {})
+        mcp_config = config.get('mcp', {})
+        self.catalog_ttl = mcp_config.get('catalog_ttl', 60)
+        self.crews_per_model = mcp_config.get('crews_per_model', 2)
+        self.state = state or get_shared_state()
+
+        self._lock = threading.Lock()
+        self._clients: dict[str, OllamaClient] = {}
+        self._catalog: list[str] = []
+        self._catalog_at = 0.0
+        self._crews: dict[str, queue.Queue] = {}
+        self._crew_counts: dict[str, int] = {}
+        self._graphs: dict[str, Any] = {}
+
+    def active_model(self) -> str:
+        """
+        Get the model active across API workers, falling back to config.
+
+        Returns:
+            str: Model name
+        """
+        default = self.ollama_config.get('default_model', 'llama2')
+        return self.state.get_active_model(default)
+
+    def client(self, model: Optional[str] = None) -> OllamaClient:
+        """
+        Get the shared client for a model.
+
+        Args:
+            model: Model name. If None, uses the active model.
+
+        Returns:
+            OllamaClient: Client reused across calls
+        """
+        model = model or self.active_model()
+        with self._lock:
+            if model not in self._clients:
+                self._clients[model] = OllamaClient(model=model, config=self.ollama_config)
+            return self._clients[model]
+
+    def list_models(self, refresh: bool = False) -> dict:
+        """
+        List available and supported models, refreshing at most every catalog_ttl seconds.
+
+        Args:
+            refresh: Ignore the cached catalog
+
+        Returns:
+            dict: available, supported (available and in config) and active models
+        """
+        if refresh or time.monotonic() - self._catalog_at > self.catalog_ttl:
+            self._catalog = self.client().list_available_models()
+            self._catalog_at = time.monotonic()
+        return {
+            'available': self._catalog,
+            'supported': probe_models(self._catalog, self.ollama_config.get('supported_models', [])),
+            'active': self.active_model(),
+        }
+
+    def warm_up(self):
+        """Import the agent frameworks, fetch the catalog and load the active model."""
+        start = time.perf_counter()
+        from app.agents import crew_agents, langgraph_agents  # noqa: F401
+        try:
+            self.list_models(refresh=True)
+            self.client().load_model()
+        except Exception as e:
+            logger.warning(f'Warm-up could not reach Ollama: {e}')
+        logger.info(f'Runtime warm in {time.perf_counter() - start:.1f}s')
+
+    @contextmanager
+    def inflight_slot(self):
+        """
+        Hold one of the server.max_inflight generation slots shared with the API.
+
+        Blocks the calling thread until a slot is free; call it from a worker
+        thread, never from the event loop.
+        """
+        limit = self.state.config.get('max_inflight', 4)
+        while (slot := self.state.try_acquire(INFLIGHT_SLOTS, limit)) is None:
+            time.sleep(0.5)
+        try:
+            yield
+        finally:
+            self.state.release(slot)
+
+    def generate(self, prompt: str, model: Optional[str] = None, emit: Emit = _ignore) -> str:
+        """
+        Generate text, emitting chunks as they arrive.
+
+        Shares the response cache and the max_inflight slots with the
+        /llm/generate endpoint.
+
+        Args:
+            prompt: Prompt text
+            model: Model name. If None, uses the active model.
+            emit: Called with each text chunk
+
+        Returns:
+            str: Full generated text
+        """
+        client = self.client(model)
+        # Same key /llm/generate uses for a non-streamed request without thinking
+        key = cache_key('generate', client.model, prompt, False, False,
+                        client.config.get('temperature', 0.7))
+        cached = self.state.cache_get(key)
+        if cached is not None:
+            emit(cached['response'])
+            return cached['response']
+
+        parts = []
+        final = {}
+        with self.inflight_slot():
+            for chunk in client.stream_generate(prompt):
+                text = chunk.get('response', '')
+                if text:
+                    emit(text)
+                    parts.append(text)
+                if chunk.get('done'):
+                    final = chunk
+
+        response = ''.join(parts)
+        self.state.cache_set(key, {
+            'response': response,
+            'model': client.model,
+            'created_at': final.get('created_at'),
+            'done': True,
+        })
+        return response
+
+    @contextmanager
+    def crew(self, model: str):
+        """
+        Check a crew out of the model's pool, building one if the pool is not full.
+
+        Crews are not safe to kick off concurrently, so each caller gets its own
+        and blocks until one is returned when all crews_per_model are busy.
+
+        Args:
+            model: Model name
+        """
+        from app.agents.crew_agents import build_analysis_crew
+
+        with self._lock:
+            pool = self._crews.setdefault(model, queue.Queue())
+            build = pool.empty() and self._crew_counts.get(model, 0) < self.crews_per_model
+            if build:
+                self._crew_counts[model] = self._crew_counts.get(model, 0) + 1
+
+        if build:
+            try:
+                # verbose=False: crew output on stdout would corrupt stdio transports
+                crew = build_analysis_crew(model, verbose=False)
+            except Exception:
+                with self._lock:
+                    self._crew_counts[model] -= 1
+                raise
+        else:
+            crew = pool.get()
+        try:
+            yield crew
+        finally:
+            crew.task_callback = None
+            pool.put(crew)
+
+    def run_crew(self, text: str, model: Optional[str] = None, emit: Emit = _ignore) -> str:
+        """
+        Run the analysis crew from the pool, emitting each task's output.
+
+        Args:
+            text: Text to analyze
+            model: Model name. If None, uses the active model.
+            emit: Called with each finished task's output
+
+        Returns:
+            str: The final summary from the crew
+        """
+        model = model or self.active_model()
+        key = cache_key('crewai', model, text)
+        cached = self.state.cache_get(key)
+        if cached is not None:
+            emit(cached['output'])
+            return cached['output']
+
+        with self.inflight_slot(), self.crew(model) as crew:
+            crew.task_callback = lambda output: emit(str(output))
+            output = str(crew.kickoff(inputs={'text': text}))
+
+        self.state.cache_set(key, {'output': output})
+        return output
+
+    def graph(self, model: str):
+        """
+        Get the compiled LangGraph workflow for a model, compiling it once.
+
+        Args:
+            model: Model name
+
+        Returns:
+            Compiled LangGraph workflow
+        """
+        from app.agents.langgraph_agents import build_graph
+
+        with self._lock:
+            if model not in self._graphs:
+                self._graphs[model] = build_graph(model)
+            return self._graphs[model]
+
+    def run_graph(self, text: str, model: Optional[str] = None, emit: Emit = _ignore) -> str:
+        """
+        Run the LangGraph workflow, emitting each node's output.
+
+        Args:
+            text: Text to analyze
+            model: Model name. If None, uses the active model.
+            emit: Called with each node's output
+
+        Returns:
+            str: The final summary
+        """
+        model = model or self.active_model()
+        key = cache_key('langgraph', model, text)
+        cached = self.state.cache_get(key)
+        if cached is not None:
+            emit(cached['output'])
+            return cached['output']
+
+        output = ''
+        with self.inflight_slot():
+            for step in self.graph(model).stream({'text': text}):
+                for node, update in step.items():
+                    field = 'summary' if node == 'summarize' else 'analysis'
+                    emit(f'[{node}] {update[field]}')
+                    if node == 'summarize':
+                        output = update['summary']
+
+        self.state.cache_set(key, {'output': output})
+        return output
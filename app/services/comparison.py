@@ -0,0 +1,291 @@
+"""Run a prompt set against several models and pipelines side by side."""
+
+import asyncio
+import logging
+import time
+from statistics import mean
+from typing import Optional
+
+from app.services.ollama_client import OllamaClient
+from app.services.shared_state import INFLIGHT_SLOTS, SharedState, get_shared_state
+from app.utils import load_config
+
+logger = logging.getLogger(__name__)
+
+PIPELINES = ('generate', 'crewai', 'langgraph')
+JOB_KIND = 'comparison'
+
+
+def _ns_to_ms(value: Optional[int]) -> Optional[float]:
+    """Convert an Ollama duration in nanoseconds to milliseconds."""
+    return round(value / 1e6, 1) if value else None
+
+
+def _mean(values: list) -> Optional[float]:
+    """Mean of the non-None values, or None if there are none."""
+    values = [v for v in values if v is not None]
+    return round(mean(values), 1) if values else None
+
+
+def timed_generate(client: OllamaClient, prompt: str) -> dict:
+    """
+    Stream one generation and measure it.
+
+    Args:
+        client: Client bound to the model under test
+        prompt: Prompt text
+
+    Returns:
+        dict: output, load_ms, ttft_ms, tokens_per_sec and total_latency_ms.
+            load_ms is Ollama's load time for this call, so a model evicted
+            and reloaded mid-comparison shows up instead of skewing ttft_ms.
+    """
+    start = time.perf_counter()
+    ttft = None
+    parts = []
+    final = {}
+    for chunk in client.stream_generate(prompt):
+        text = chunk.get('response', '')
+        if text and ttft is None:
+            ttft = time.perf_counter() - start
+        parts.append(text)
+        if chunk.get('done'):
+            final = chunk
+    total = time.perf_counter() - start
+
+    eval_count = final.get('eval_count')
+    eval_duration = final.get('eval_duration')
+    tokens_per_sec = None
+    if eval_count and eval_duration:
+        tokens_per_sec = round(eval_count / (eval_duration / 1e9), 1)
+
+    return {
+        'output': ''.join(parts),
+        'load_ms': _ns_to_ms(final.get('load_duration')),
+        'ttft_ms': round(ttft * 1000, 1) if ttft is not None else None,
+        'tokens_per_sec': tokens_per_sec,
+        'total_latency_ms': round(total * 1000, 1),
+    }
+
+
+def timed_pipeline(pipeline: str, model: str, prompt: str) -> dict:
+    """
+    Run one prompt through an agent pipeline and measure it.
+
+    Agent pipelines make several LLM calls, so only total latency is reported.
+
+    Args:
+        pipeline: 'crewai' or 'langgraph'
+        model: Ollama model name
+        prompt: Text handed to the pipeline
+
+    Returns:
+        dict: output, load_ms, ttft_ms, tokens_per_sec and total_latency_ms
+    """
+    start = time.perf_counter()
+    # Imported lazily: both frameworks are slow to import and optional for 'generate'
+    if pipeline == 'crewai':
+        from app.agents.crew_agents import run_analysis_crew
+        # verbose=False: concurrent crews would interleave their output on stdout
+        output = run_analysis_crew(prompt, model=model, verbose=False)
+    else:
+        from app.agents.langgraph_agents import run_langgraph_flow
+        output = run_langgraph_flow(prompt, model=model)
+    total = time.perf_counter() - start
+    return {
+        'output': output,
+        'load_ms': None,
+        'ttft_ms': None,
+        'tokens_per_sec': None,
+        'total_latency_ms': round(total * 1000, 1),
+    }
+
+
+class ComparisonRunner():
+
+    def __init__(self, config: Optional[dict] = None, state: Optional[SharedState] = None):
+        """
+        Initialize ComparisonRunner.
+
+        Args:
+            config: Full configuration dict. If None, loads from config.yaml.
+            state: Where results are stored. If None, uses the shared state.
+        """
+        if config is None:
+            config = load_config()
+
+        self.ollama_config = config.get('ollama', {})
+        comparison_config = config.get('comparison', {})
+        self.per_model_concurrency = comparison_config.get('per_model_concurrency', 1)
+        self.max_models_in_flight = comparison_config.get('max_models_in_flight', 1)
+        self.state = state or get_shared_state()
+
+    async def _load(self, model: str) -> dict:
+        """Load a model and report how long Ollama took to do it."""
+        client = OllamaClient(model=model, config=self.ollama_config)
+        try:
+            response = await asyncio.to_thread(client.load_model)
+            return {'load_time_ms': _ns_to_ms(response.get('load_duration')), 'error': None}
+        except Exception as e:
+            return {'load_time_ms': None, 'error': str(e)}
+
+    async def _acquire_slot(self) -> str:
+        """Wait for a generation slot shared with the API's /llm/generate."""
+        limit = self.state.config.get('max_inflight', 4)
+        # SQLite can wait on other workers' locks, so keep it off the event loop
+        while (slot := await asyncio.to_thread(self.state.try_acquire, INFLIGHT_SLOTS, limit)) is None:
+            await asyncio.sleep(0.5)
+        return slot
+
+    async def _run_one(self, model: str, pipeline: str, prompt: str,
+                       limit: asyncio.Semaphore) -> dict:
+        """Run one (model, pipeline, prompt) cell under the model's and the server's limits."""
+        run = {'model': model, 'pipeline': pipeline, 'prompt': prompt}
+        async with limit:
+            slot = await self._acquire_slot()
+            try:
+                if pipeline == 'generate':
+                    client = OllamaClient(model=model, config=self.ollama_config)
+                    metrics = await asyncio.to_thread(timed_generate, client, prompt)
+                else:
+                    metrics = await asyncio.to_thread(timed_pipeline, pipeline, model, prompt)
+                run.update(metrics, error=None)
+            except Exception as e:
+                logger.error(f'{pipeline} run failed for {model}: {e}')
+                run.update(output=None, load_ms=None, ttft_ms=None, tokens_per_sec=None,
+                           total_latency_ms=None, error=str(e))
+            finally:
+                await asyncio.to_thread(self.state.release, slot)
+        return run
+
+    async def _run_model(self, model: str, prompts: list[str], pipelines: list[str],
+                         models_in_flight: asyncio.Semaphore) -> tuple[dict, list[dict]]:
+        """Load one model, then run all its prompts at up to per_model_concurrency at once."""
+        async with models_in_flight:
+            load = await self._load(model)
+            if load['error'] is not None:
+                return load, []
+            limit = asyncio.Semaphore(self.per_model_concurrency)
+            runs = await asyncio.gather(*(
+                self._run_one(model, pipeline, prompt, limit)
+                for prompt in prompts
+                for pipeline in pipelines
+            ))
+            return load, list(runs)
+
+    async def run(self, prompts: list[str], models: Optional[list[str]] = None,
+                  pipelines: Optional[list[str]] = None) -> dict:
+        """
+        Run prompts on every model and pipeline.
+
+        At most max_models_in_flight models are loaded and run at a time (one
+        by default), so Ollama does not evict a model between its load and
+        its runs. Within a model, up to per_model_concurrency prompts run at
+        once, and every run also takes a server.max_inflight slot shared with
+        /llm/generate. The result is stored in the shared job table; if the
+        run fails or is interrupted the job is marked failed.
+
+        Args:
+            prompts: Prompt texts
+            models: Models to compare. If None, uses supported_models.
+            pipelines: Any of 'generate', 'crewai', 'langgraph'. Default 'generate'.
+
+        Returns:
+            dict: Comparison with id, per-run results and per-model summary
+
+        Raises:
+            ValueError: If a pipeline is unknown or no prompts/models are given
+        """
+        # Only an omitted list means "all supported"; an explicit [] is an error
+        if models is None:
+            models = self.ollama_config.get('supported_models', [])
+        pipelines = pipelines or ['generate']
+        unknown = [p for p in pipelines if p not in PIPELINES]
+        if unknown:
+            raise ValueError(f"Unknown pipelines: {', '.join(unknown)}")
+        if not prompts or not models:
+            raise ValueError("At least one prompt and one model are required")
+
+        job_id = await asyncio.to_thread(
+            self.state.enqueue,
+            JOB_KIND,
+            {'prompts': prompts, 'models': models, 'pipelines': pipelines},
+            status='running'
+        )
+        logger.info(f'Comparison {job_id}: {len(models)} models x '
+                    f'{len(pipelines)} pipelines x {len(prompts)} prompts')
+
+        try:
+            models_in_flight = asyncio.Semaphore(self.max_models_in_flight)
+            results = await asyncio.gather(*(
+                self._run_model(model, prompts, pipelines, models_in_flight)
+                for model in models
+            ))
+
+            loads = {model: load for model, (load, _) in zip(models, results)}
+            runs = [run for _, model_runs in results for run in model_runs]
+            # Side by side: every model's answer to a prompt next to each other
+            runs.sort(key=lambda r: (prompts.index(r['prompt']), pipelines.index(r['pipeline'])))
+
+            summary = []
+            for model in models:
+                for pipeline in pipelines:
+                    cell = [r for r in runs if r['model'] == model and r['pipeline'] == pipeline]
+                    summary.append({
+                        'model': model,
+                        'pipeline': pipeline,
+                        'load_time_ms': loads[model]['load_time_ms'],
+                        'mean_run_load_ms': _mean([r['load_ms'] for r in cell]),
+                        'mean_ttft_ms': _mean([r['ttft_ms'] for r in cell]),
+                        'mean_tokens_per_sec': _mean([r['tokens_per_sec'] for r in cell]),
+                        'mean_total_latency_ms': _mean([r['total_latency_ms'] for r in cell]),
+                        'errors': sum(1 for r in cell if r['error'])
+                                  + (len(prompts) if loads[model]['error'] else 0),
+                        'load_error': loads[model]['error'],
+                    })
+
+            result = {
+                'id': job_id,
+                'prompts': prompts,
+                'models': models,
+                'pipelines': pipelines,
+                'runs': runs,
+                'summary': summary,
+            }
+        except BaseException as e:
+            # Includes cancellation and Ctrl+C so the job never stays 'running'
+            await asyncio.to_thread(
+                self.state.complete, job_id, {'error': str(e) or type(e).__name__}, 'failed'
+            )
+            raise
+
+        await asyncio.to_thread(self.state.complete, job_id, result)
+        return result
+
+    def get(self, comparison_id: str) -> Optional[dict]:
+        """
+        Fetch a stored comparison job.
+
+        Args:
+            comparison_id: Id returned by run()
+
+        Returns:
+            dict: Job with status ('running', 'done' or 'failed') and result,
+                or None if the id is unknown
+        """
+        job = self.state.get_job(comparison_id)
+        if job is None or job['kind'] != JOB_KIND:
+            return None
+        return job
+
+    def history(self, limit: int = 20) -> list[dict]:
+        """
+        List recent comparisons, newest first.
+
+        Args:
+            limit: Maximum number of comparisons
+
+        Returns:
+            list[dict]: Comparison ids with status and timestamps
+        """
+        return self.state.list_jobs(JOB_KIND, limit)
@@ -39,11 +39,8 @@ class OllamaClient():
         """
         try:
             response = ollama.list()
-            # ollama.list() returns a dict with 'models' key containing list of model objects
-            if isinstance(response, dict) and 'models' in response:
-                model_names = [model['name'] for model in response['models']]
-            else:
-                model_names = []
+            # ollama.list() returns a ListResponse whose entries name the model in 'model'
+            model_names = [model['model'] for model in response.get('models') or []]
 
             logger.info(f'Available models: {model_names}')
             return model_names
@@ -73,8 +70,48 @@ class OllamaClient():
             return response
         except Exception as e:
             logger.error(f'Generation failed: {e}')
-            raise 
-    
+            raise
+
+    def stream_generate(self, user_input: str, think: bool = False):
+        """
+        Generate text incrementally using the current model.
+
+        Args:
+            user_input: The prompt/input text
+            think: Enable thinking mode (if supported by model)
+
+        Yields:
+            dict: Response chunks from Ollama; the last one has done=True
+                and carries the timing and token counts
+        """
+        try:
+            for chunk in ollama.generate(
+                model=self.model,
+                prompt=user_input,
+                options={'temperature': self.config.get('temperature', 0.7)},
+                stream=True
+            ):
+                yield chunk
+            logger.debug(f'Streamed response from {self.model}')
+        except Exception as e:
+            logger.error(f'Streaming generation failed: {e}')
+            raise
+
+    def load_model(self) -> dict:
+        """
+        Load the current model into memory without generating anything.
+
+        Returns:
+            dict: Response from Ollama; load_duration holds the load time in ns
+        """
+        try:
+            response = ollama.generate(model=self.model, prompt='')
+            logger.info(f'Loaded model: {self.model}')
+            return response
+        except Exception as e:
+            logger.error(f'Failed to load model {self.model}: {e}')
+            raise
+
     def _check_model(self, model: str) -> bool:
         """
         Check if a model is available.
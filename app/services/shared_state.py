@@ -0,0 +1,383 @@
+"""Shared cross-process state backed by SQLite in WAL mode.
+
+Every uvicorn worker opens its own connection to the same database file, so
+the active model, the response cache, admission slots and the job table
+stay consistent across processes without any external service.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional
+
+from app.utils import PROJECT_ROOT, load_config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_PATH = ".state/playground.db"
+
+# Admission slot group for generations, shared by every caller of Ollama
+INFLIGHT_SLOTS = 'generate_inflight'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS response_cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS slots (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    pid INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_kind_idx ON jobs (kind, created_at);
+"""
+
+
+def cache_key(namespace: str, *parts: Any) -> str:
+    """
+    Build a response cache key from a namespace and JSON-serializable parts.
+
+    Example:
+        >>> cache_key('generate', 'mistral', 'Hello', False)
+        'generate:...'
+    """
+    raw = json.dumps(parts)
+    return f'{namespace}:' + hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process on this host is still running."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SharedState():
+
+    def __init__(self, path: Optional[str] = None, config: Optional[dict] = None):
+        """
+        Initialize SharedState.
+
+        Args:
+            path: SQLite database file. If None, uses server.state_path from config.
+                Relative paths resolve against the project root.
+            config: Server configuration dict. If None, loads from config.yaml.
+        """
+        if config is None:
+            full_config = load_config()
+            config = full_config.get('server', {})
+
+        self.config = config
+        # Relative paths are anchored at the project root, not the working directory
+        self.path = str(PROJECT_ROOT / (path or config.get('state_path', DEFAULT_STATE_PATH)))
+        self.cache_ttl = config.get('cache_ttl', 300)
+        self._local = threading.local()
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._connect().executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Return this thread's connection, opening it on first use.
+
+        Connections are keyed by pid as well so a forked worker never reuses
+        a handle inherited from the parent process.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """Run the enclosed statements in a single write transaction."""
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        else:
+            conn.execute('COMMIT')
+
+    # Key/value -----------------------------------------------------------
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Read a JSON value from the shared key/value store.
+
+        Args:
+            key: Key to read
+            default: Value returned if the key is missing
+
+        Returns:
+            The stored value, or default
+        """
+        row = self._connect().execute(
+            'SELECT value FROM kv WHERE key = ?', (key,)
+        ).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set(self, key: str, value: Any):
+        """
+        Write a JSON value to the shared key/value store.
+
+        Args:
+            key: Key to write
+            value: JSON-serializable value
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)',
+                (key, json.dumps(value))
+            )
+
+    def get_active_model(self, default: Optional[str] = None) -> Optional[str]:
+        """
+        Get the model selected by the last successful switch in any worker.
+
+        Args:
+            default: Model returned if no switch has happened yet
+
+        Returns:
+            str: Active model name
+        """
+        return self.get('active_model', default)
+
+    def set_active_model(self, model: str):
+        """
+        Make a model the active one for every worker.
+
+        Args:
+            model: Model name
+        """
+        self.set('active_model', model)
+        logger.info(f'Active model set to {model}')
+
+    # Response cache ------------------------------------------------------
+
+    def cache_get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        row = self._connect().execute(
+            'SELECT value FROM response_cache WHERE key = ? AND expires_at > ?',
+            (key, time.time())
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def cache_set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        Store a response in the shared cache and evict expired entries.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Seconds to keep the entry. If None, uses server.cache_ttl.
+        """
+        now = time.time()
+        ttl = self.cache_ttl if ttl is None else ttl
+        with self._transaction() as conn:
+            conn.execute('DELETE FROM response_cache WHERE expires_at <= ?', (now,))
+            conn.execute(
+                'INSERT OR REPLACE INTO response_cache (key, value, expires_at) '
+                'VALUES (?, ?, ?)',
+                (key, json.dumps(value), now + ttl)
+            )
+
+    # Admission slots -----------------------------------------------------
+
+    def try_acquire(self, name: str, limit: int, ttl: Optional[float] = None) -> Optional[str]:
+        """
+        Take one admission slot if fewer than limit are in use across all workers.
+
+        Each slot is a row owned by the calling process. Slots whose process
+        has died or whose ttl has passed are reaped first, so a worker killed
+        mid-request cannot hold its slot for good.
+
+        Args:
+            name: Slot group name
+            limit: Maximum concurrent holders
+            ttl: Seconds before an unreleased slot expires. If None, uses server.slot_ttl.
+
+        Returns:
+            str: Slot id to pass to release(), or None if all slots are taken
+        """
+        now = time.time()
+        ttl = self.config.get('slot_ttl', 600) if ttl is None else ttl
+        with self._transaction() as conn:
+            conn.execute('DELETE FROM slots WHERE expires_at <= ?', (now,))
+            pids = [r[0] for r in conn.execute('SELECT DISTINCT pid FROM slots')]
+            for pid in pids:
+                if not _pid_alive(pid):
+                    conn.execute('DELETE FROM slots WHERE pid = ?', (pid,))
+
+            (current,) = conn.execute(
+                'SELECT COUNT(*) FROM slots WHERE name = ?', (name,)
+            ).fetchone()
+            if current >= limit:
+                return None
+            slot_id = uuid.uuid4().hex
+            conn.execute(
+                'INSERT INTO slots (id, name, pid, expires_at) VALUES (?, ?, ?, ?)',
+                (slot_id, name, os.getpid(), now + ttl)
+            )
+        return slot_id
+
+    def release(self, slot_id: str):
+        """
+        Give back an admission slot taken with try_acquire().
+
+        Args:
+            slot_id: Slot id returned by try_acquire()
+        """
+        with self._transaction() as conn:
+            conn.execute('DELETE FROM slots WHERE id = ?', (slot_id,))
+
+    def reset_slots(self):
+        """Clear all admission slots; called once at startup before workers spawn."""
+        with self._transaction() as conn:
+            conn.execute('DELETE FROM slots')
+
+    # Jobs ----------------------------------------------------------------
+
+    def enqueue(self, kind: str, payload: Any, status: str = 'running') -> str:
+        """
+        Record a job that the caller runs itself, e.g. a model comparison.
+
+        Any worker can then look the job up by id while it runs and after
+        complete() stores its result.
+
+        Args:
+            kind: Job type
+            payload: JSON-serializable job input
+            status: Initial status
+
+        Returns:
+            str: Job id
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                'INSERT INTO jobs (id, kind, payload, status, created_at, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (job_id, kind, json.dumps(payload), status, now, now)
+            )
+        return job_id
+
+    def complete(self, job_id: str, result: Any, status: str = 'done'):
+        """
+        Record the result of a job.
+
+        Args:
+            job_id: Job id returned by enqueue()
+            result: JSON-serializable job output
+            status: Final status ('done' or 'failed')
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                'UPDATE jobs SET status = ?, result = ?, updated_at = ? WHERE id = ?',
+                (status, json.dumps(result), time.time(), job_id)
+            )
+
+    def get_job(self, job_id: str) -> Optional[dict]:
+        """
+        Fetch a job and its result.
+
+        Args:
+            job_id: Job id
+
+        Returns:
+            dict: Job fields, or None if unknown
+        """
+        row = self._connect().execute(
+            'SELECT id, kind, payload, status, result, created_at, updated_at '
+            'FROM jobs WHERE id = ?',
+            (job_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            'id': row[0],
+            'kind': row[1],
+            'payload': json.loads(row[2]),
+            'status': row[3],
+            'result': json.loads(row[4]) if row[4] is not None else None,
+            'created_at': row[5],
+            'updated_at': row[6],
+        }
+
+    def list_jobs(self, kind: str, limit: int = 20) -> list[dict]:
+        """
+        List the most recent jobs of a kind, newest first.
+
+        Args:
+            kind: Job type
+            limit: Maximum number of jobs to return
+
+        Returns:
+            list[dict]: Job fields without payload or result
+        """
+        rows = self._connect().execute(
+            'SELECT id, status, created_at, updated_at FROM jobs '
+            'WHERE kind = ? ORDER BY created_at DESC LIMIT ?',
+            (kind, limit)
+        ).fetchall()
+        return [
+            {'id': r[0], 'kind': kind, 'status': r[1], 'created_at': r[2], 'updated_at': r[3]}
+            for r in rows
+        ]
+
+
+_state: Optional[SharedState] = None
+
+
+def get_shared_state() -> SharedState:
+    """
+    Return the process-wide SharedState, creating it on first use.
+
+    Returns:
+        SharedState: Shared state handle for this process
+    """
+    global _state
+    if _state is None:
+        _state = SharedState()
+    return _state
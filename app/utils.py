@@ -4,11 +4,17 @@ import yaml
 from pathlib import Path
 from typing import Optional
 
+# Repository root, so config and state resolve no matter the working directory
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
 
 def load_config(config_path: str = "config.yaml") -> dict:
     """
     Load configuration from YAML file.
 
+    A relative path is looked up in the working directory first, then in
+    the project root.
+
     Args:
         config_path: Path to config file (default: config.yaml)
 
@@ -25,6 +31,8 @@ def load_config(config_path: str = "config.yaml") -> dict:
         >>> print(ollama_config['base_url'])
     """
     config_file = Path(config_path)
+    if not config_file.exists() and not config_file.is_absolute():
+        config_file = PROJECT_ROOT / config_file
 
     if not config_file.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
@@ -44,15 +52,20 @@ def probe_models(available_models: list[str], supported_models: list[str]) -> li
         supported_models: Models supported by this application
 
     Returns:
-        list[str]: Models that are both available and supported
+        list[str]: Models that are both available and supported. A supported
+            name without a tag matches any tag of that model.
 
     Example:
-        >>> available = ['llama2', 'mistral', 'random-model']
+        >>> available = ['llama2:latest', 'mistral', 'random-model']
         >>> supported = ['llama2', 'codellama']
         >>> probe_models(available, supported)
         ['llama2']
     """
-    return [model for model in supported_models if model in available_models]
+    # Ollama reports tagged names ('mistral:latest'); untagged config names match any tag
+    return [
+        model for model in supported_models
+        if any(a == model or a.startswith(f'{model}:') for a in available_models)
+    ]
 
 
 def setup_logging(level: str = "INFO"):
@@ -0,0 +1,82 @@
+"""Compare models side by side from the command line.
+
+Example:
+    python compare.py -p "What is an AI agent?" -m mistral -m gemma3:1b
+    python compare.py --prompts-file prompts.txt --pipeline generate --pipeline crewai
+    python compare.py --show <comparison-id>
+"""
+
+import argparse
+import asyncio
+import json
+
+from app.services.comparison import PIPELINES, ComparisonRunner
+from app.utils import setup_logging
+
+
+def print_report(result: dict):
+    """Print the per-model summary table followed by outputs side by side."""
+    header = f"{'model':<20} {'pipeline':<10} {'load ms':>9} {'reload ms':>9} {'ttft ms':>9} {'tok/s':>7} {'latency ms':>11} {'errors':>6}"
+    print(f"Comparison {result['id']}")
+    print(header)
+    print("-" * len(header))
+    for row in result['summary']:
+        cells = [row['load_time_ms'], row['mean_run_load_ms'], row['mean_ttft_ms'],
+                 row['mean_tokens_per_sec'], row['mean_total_latency_ms']]
+        load, reload, ttft, tps, latency = ('-' if v is None else v for v in cells)
+        print(f"{row['model']:<20} {row['pipeline']:<10} {load:>9} {reload:>9} {ttft:>9} {tps:>7} {latency:>11} {row['errors']:>6}")
+
+    for prompt in result['prompts']:
+        print("\n" + "=" * 80)
+        print(f"PROMPT: {prompt}")
+        print("=" * 80)
+        for run in result['runs']:
+            if run['prompt'] != prompt:
+                continue
+            print(f"\n[{run['model']} / {run['pipeline']}]")
+            print(run['error'] and f"ERROR: {run['error']}" or run['output'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run prompts on several models and compare them")
+    parser.add_argument("-p", "--prompt", action="append", default=[], help="Prompt (repeatable)")
+    parser.add_argument("--prompts-file", help="File with one prompt per line")
+    parser.add_argument("-m", "--model", action="append", help="Model (repeatable, default: supported_models)")
+    parser.add_argument("--pipeline", action="append", choices=PIPELINES, help="Pipeline (repeatable, default: generate)")
+    parser.add_argument("--show", metavar="ID", help="Print a stored comparison instead of running one")
+    parser.add_argument("--history", action="store_true", help="List stored comparisons")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON")
+    args = parser.parse_args()
+
+    setup_logging("WARNING")
+    runner = ComparisonRunner()
+
+    if args.history:
+        print(json.dumps(runner.history(), indent=2))
+        return
+
+    if args.show:
+        job = runner.get(args.show)
+        if job is None:
+            parser.error(f"Comparison {args.show} not found")
+        if job['status'] != 'done':
+            print(json.dumps({k: job[k] for k in ('id', 'status', 'result')}, indent=2))
+            return
+        result = job['result']
+    else:
+        prompts = list(args.prompt)
+        if args.prompts_file:
+            with open(args.prompts_file, 'r') as f:
+                prompts += [line.strip() for line in f if line.strip()]
+        if not prompts:
+            parser.error("Give at least one --prompt or --prompts-file")
+        result = asyncio.run(runner.run(prompts, models=args.model, pipelines=args.pipeline))
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_report(result)
+
+
+if __name__ == "__main__":
+    main()
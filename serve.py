@@ -0,0 +1,77 @@
+"""Production entry point: N workers sharing state through SQLite.
+
+Uses gunicorn with preloaded app code when it is installed
+(`uv sync --extra server`), so workers fork from a parent that already
+imported the app. Without gunicorn it falls back to uvicorn's built-in
+multi-process mode, where every worker imports the app itself.
+"""
+
+import argparse
+import logging
+import os
+
+import uvicorn
+
+from app.services.shared_state import SharedState
+from app.utils import load_config, setup_logging
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args(server_config: dict) -> argparse.Namespace:
+    """Parse command line overrides for the server section of config.yaml."""
+    parser = argparse.ArgumentParser(description="Run the API with multiple workers")
+    parser.add_argument("--host", default=server_config.get("host", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=server_config.get("port", 8000))
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=server_config.get("workers") or os.cpu_count() or 1,
+        help="Number of worker processes (default: server.workers or CPU count)"
+    )
+    return parser.parse_args()
+
+
+def run_gunicorn(host: str, port: int, workers: int, timeout: int):
+    """Serve with gunicorn, importing the app once before forking workers."""
+    from gunicorn.app.base import BaseApplication
+    from app.main import app
+
+    class PreloadedApplication(BaseApplication):
+
+        def load_config(self):
+            self.cfg.set("bind", f"{host}:{port}")
+            self.cfg.set("workers", workers)
+            self.cfg.set("worker_class", "uvicorn_worker.UvicornWorker")
+            self.cfg.set("preload_app", True)
+            # Default 30s kills workers during long generations
+            self.cfg.set("timeout", timeout)
+
+        def load(self):
+            return app
+
+    PreloadedApplication().run()
+
+
+def main():
+    setup_logging("INFO")
+    server_config = load_config().get("server", {})
+    args = parse_args(server_config)
+
+    # Create the schema and clear stale admission slots before any worker starts
+    state = SharedState(config=server_config)
+    state.reset_slots()
+
+    try:
+        import gunicorn  # noqa: F401
+    except ImportError:
+        logger.info(f"Starting {args.workers} uvicorn workers on {args.host}:{args.port} "
+                    "(gunicorn not installed, app is not preloaded)")
+        uvicorn.run("app.main:app", host=args.host, port=args.port, workers=args.workers)
+    else:
+        logger.info(f"Starting {args.workers} gunicorn workers on {args.host}:{args.port}")
+        run_gunicorn(args.host, args.port, args.workers, server_config.get("timeout", 300))
+
+
+if __name__ == "__main__":
+    main()
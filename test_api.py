@@ -2,6 +2,20 @@
 
 import requests
 import json
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import asyncio
+import ollama
+
+from ollama import ListResponse
+
+from app.services.agent_runtime import AgentRuntime
+from app.services.comparison import ComparisonRunner
+from app.services.shared_state import SharedState, cache_key
 
 BASE_URL = "http://localhost:8000"
 
@@ -59,6 +73,196 @@ def test_generate():
     print()
 
 
+def test_rate_limit(max_inflight: int = 4):
+    """Test that generations beyond server.max_inflight get a 429."""
+    print("Testing generate admission limit...")
+
+    def generate(i):
+        # Distinct prompts so nothing is served from the response cache
+        payload = {"prompt": f"Count to {20 + i} slowly. ({time.time()})"}
+        return requests.post(f"{BASE_URL}/llm/generate", json=payload).status_code
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_inflight + 2) as pool:
+            statuses = list(pool.map(generate, range(max_inflight + 2)))
+        print(f"Statuses: {statuses}")
+        print(f"429 responses: {statuses.count(429)} (expected at least 1)")
+    except Exception as e:
+        print(f"Error: {e}")
+    print()
+
+
+def test_shared_state():
+    """Test SharedState admission slots, cache expiry and jobs (no server needed)."""
+    print("Testing shared state...")
+    state = SharedState(path=f"{tempfile.mkdtemp()}/state.db", config={})
+
+    # Admission: limit is enforced and release frees a slot
+    first = state.try_acquire("gen", limit=2)
+    second = state.try_acquire("gen", limit=2)
+    assert first and second
+    assert state.try_acquire("gen", limit=2) is None
+    state.release(first)
+    third = state.try_acquire("gen", limit=2)
+    assert third is not None
+
+    # Slots held by a dead process are reaped
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+    with state._transaction() as conn:
+        conn.execute("DELETE FROM slots")
+        conn.execute(
+            "INSERT INTO slots (id, name, pid, expires_at) VALUES (?, ?, ?, ?)",
+            ("stale", "gen", dead.pid, time.time() + 600)
+        )
+    assert state.try_acquire("gen", limit=1) is not None
+
+    # Expired slots are reaped
+    state.reset_slots()
+    assert state.try_acquire("gen", limit=1, ttl=0) is not None
+    assert state.try_acquire("gen", limit=1) is not None
+
+    # Cache entries expire
+    state.cache_set("k", {"a": 1}, ttl=60)
+    state.cache_set("gone", {"a": 2}, ttl=0)
+    assert state.cache_get("k") == {"a": 1}
+    assert state.cache_get("gone") is None
+
+    # Job lifecycle
+    job_id = state.enqueue("demo", {"x": 1})
+    assert state.get_job(job_id)["status"] == "running"
+    state.complete(job_id, {"y": 2})
+    job = state.get_job(job_id)
+    assert job["status"] == "done" and job["result"] == {"y": 2}
+
+    print("Shared state OK")
+    print()
+
+
+def test_compare():
+    """Test the multi-model comparison endpoint."""
+    print("Testing compare endpoint...")
+    try:
+        models = requests.get(f"{BASE_URL}/llm/models").json()["models"][:2]
+        payload = {
+            "prompts": ["What is an AI agent? Answer in one sentence."],
+            "models": models,
+            "pipelines": ["generate"]
+        }
+        response = requests.post(f"{BASE_URL}/compare", json=payload)
+        print(f"Status: {response.status_code}")
+        result = response.json()
+        print(f"Summary: {json.dumps(result.get('summary'), indent=2)}")
+
+        stored = requests.get(f"{BASE_URL}/compare/{result['id']}")
+        print(f"Stored lookup status: {stored.status_code} (expected 200)")
+        missing = requests.get(f"{BASE_URL}/compare/does-not-exist")
+        print(f"Unknown id status: {missing.status_code} (expected 404)")
+    except Exception as e:
+        print(f"Error: {e}")
+    print()
+
+
+def test_comparison_runner():
+    """Test ComparisonRunner summary, error counts and job status (no server needed)."""
+    print("Testing comparison runner...")
+    state = SharedState(path=f"{tempfile.mkdtemp()}/state.db", config={})
+    runner = ComparisonRunner(config={'ollama': {}}, state=state)
+
+    def fake_generate(model, prompt, options=None, stream=False):
+        if model == "broken":
+            raise RuntimeError("model not found")
+        if not stream:
+            return {"load_duration": 2_000_000}
+        return iter([
+            {"response": "hello ", "done": False},
+            {"response": model, "done": True, "load_duration": 0,
+             "eval_count": 10, "eval_duration": 500_000_000},
+        ])
+
+    original = ollama.generate
+    ollama.generate = fake_generate
+    try:
+        result = asyncio.run(runner.run(["p1", "p2"], models=["a", "broken"]))
+    finally:
+        ollama.generate = original
+
+    summary = {row["model"]: row for row in result["summary"]}
+    assert len(result["runs"]) == 2
+    assert all(run["output"] == "hello a" for run in result["runs"])
+    assert summary["a"]["load_time_ms"] == 2.0
+    assert summary["a"]["mean_tokens_per_sec"] == 20.0
+    assert summary["a"]["errors"] == 0
+    assert summary["broken"]["errors"] == 2
+    assert summary["broken"]["load_error"] == "model not found"
+    assert runner.get(result["id"])["status"] == "done"
+    assert runner.get("unknown") is None
+
+    # An explicit empty model list is rejected, not widened to supported_models
+    try:
+        asyncio.run(runner.run(["p"], models=[]))
+        raise AssertionError("empty model list was accepted")
+    except ValueError:
+        pass
+
+    # A comparison that raises is marked failed instead of staying 'running'
+    async def explode(*args):
+        raise RuntimeError("boom")
+
+    runner._run_model = explode
+    try:
+        asyncio.run(runner.run(["p"], models=["a"]))
+    except RuntimeError:
+        pass
+    failed = runner.get(runner.history()[0]["id"])
+    assert failed["status"] == "failed" and failed["result"] == {"error": "boom"}
+
+    print("Comparison runner OK")
+    print()
+
+
+def test_agent_runtime():
+    """Test the MCP runtime's model catalog and shared response cache (no server needed)."""
+    print("Testing agent runtime...")
+    state = SharedState(path=f"{tempfile.mkdtemp()}/state.db", config={})
+    config = {"ollama": {"default_model": "mistral", "supported_models": ["mistral", "qwen3"]}}
+    runtime = AgentRuntime(config=config, state=state)
+    calls = []
+
+    def fake_generate(model, prompt, options=None, stream=False):
+        calls.append(prompt)
+        # The runtime holds a max_inflight slot shared with /llm/generate
+        (held,) = state._connect().execute("SELECT COUNT(*) FROM slots").fetchone()
+        assert held == 1
+        return iter([
+            {"response": "hi ", "done": False},
+            {"response": "there", "done": True, "created_at": "now"},
+        ])
+
+    original_generate, original_list = ollama.generate, ollama.list
+    ollama.generate = fake_generate
+    ollama.list = lambda: ListResponse(models=[{"model": "mistral:latest"}, {"model": "llava"}])
+    try:
+        catalog = runtime.list_models(refresh=True)
+        chunks = []
+        assert runtime.generate("hello", emit=chunks.append) == "hi there"
+        assert chunks == ["hi ", "there"]
+        assert runtime.generate("hello") == "hi there"
+    finally:
+        ollama.generate, ollama.list = original_generate, original_list
+
+    assert catalog["available"] == ["mistral:latest", "llava"]
+    assert catalog["supported"] == ["mistral"]
+    assert catalog["active"] == "mistral"
+    assert calls == ["hello"]
+    assert state._connect().execute("SELECT COUNT(*) FROM slots").fetchone() == (0,)
+    # Same entry /llm/generate reads for this model and prompt
+    assert state.cache_get(cache_key("generate", "mistral", "hello", False, False, 0.7))["response"] == "hi there"
+
+    print("Agent runtime OK")
+    print()
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("API Test Suite")
@@ -77,6 +281,11 @@ if __name__ == "__main__":
     test_health()
     test_models()
     test_generate()
+    test_rate_limit()
+    test_shared_state()
+    test_compare()
+    test_comparison_runner()
+    test_agent_runtime()
 
     print("=" * 60)
     print("Tests complete!")